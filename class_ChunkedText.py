@@ -0,0 +1,417 @@
+# ==========================================
+# File: class_ChunkedText.py
+# Author: Dietmar Benndorf
+# Date: 2026-10-19
+# Description:
+#    Provides a ChunkedText class for German texts that are too long to be
+#    parsed with a single spaCy call (e.g. thesis submissions). The text is
+#    split on sentence boundaries into chunks which are parsed one after
+#    another; partial results (counts, connector tallies, sentence length
+#    moments, MATTR/MTLD state) are merged so that the final values are the
+#    same as the ones computed by the Text class.
+# ==========================================
+
+
+from collections import Counter, deque
+from fractions import Fraction
+import math
+from nltk.tokenize import sent_tokenize
+from nltk.tokenize import word_tokenize
+import re
+
+from class_Text import LEVEL_SCORES, get_connector_freq_stats, load_model
+from resources.list_basic_vocabulary import get_basic_vocabulary
+from resources.list_connectors import get_connectors
+
+
+class ChunkedText:
+    """
+    Represents a (very long) German text and provides the same basic linguistic
+    analysis as Text, but parses the text chunk by chunk.
+
+    Only aggregated values are kept in memory, so the token and sentence lists
+    of Text (words, lemma_pos, sentences, connectors) are not available and
+    sentence_length_stats has no "lengths" entry.
+    """
+
+    def __init__(self, id: str, text: str = None, pieces=None, max_chars: int = 100_000,
+                 short_lt: int = 6, long_gt: int = 25, mtld_t: float = 0.72, mattr_window: int = 50,
+                 model: str = "de_core_news_sm", disable: tuple = (), batch_size: int = 1):
+        """
+        Parameters
+        ----------
+        id : str
+            Text id.
+        text : str, optional
+            Raw input text in German.
+        pieces : iterable of str, optional
+            Raw input text as consecutive pieces (e.g. blocks read from a file).
+            Used instead of `text`.
+        max_chars : int, optional (default=100000)
+            Maximum number of characters per chunk passed to spaCy. A single
+            sentence longer than this is split at whitespace (each part then
+            counts as a sentence).
+            Peak memory is about `max_chars` x `batch_size` characters of parsed Docs.
+        short_lt, long_gt : int
+            Thresholds for short/long sentences (see Text.get_sentence_length_stats).
+        mtld_t : float
+            TTR threshold for MTLD (see Text.get_mtld).
+        mattr_window : int
+            Window size for MATTR (see Text.get_mattr).
+        model : str, optional (default="de_core_news_sm")
+            Name of the spaCy model.
+        disable : tuple of str, optional
+            Pipeline components to disable.
+        batch_size : int, optional (default=1)
+            Number of chunks spaCy parses at once.
+        """
+        self.id = id
+        self.model = model
+        self.disable = tuple(disable)
+        self.max_chars = max_chars
+
+        self.basic_vocab = set(w.lower() for w in get_basic_vocabulary())
+        self.all_connectors = get_connectors()
+
+        if pieces is None:
+            pieces = (text[i:i + max_chars] for i in range(0, len(text), max_chars))
+
+        self._init_partials(short_lt, long_gt, mtld_t, mattr_window)
+
+        nlp = load_model(self.model, self.disable)
+        chunks = ((" ".join(sentences), sentences) for sentences in self.iter_chunks(pieces))
+        for doc, sentences in nlp.pipe(chunks, as_tuples=True, batch_size=batch_size):
+            self.add_chunk(sentences, doc.text, [
+                (token.lemma_.lower(), token.pos_)
+                for token in doc
+                if token.is_alpha
+            ])
+
+        self._finalize()
+
+    @classmethod
+    def from_file(cls, id: str, path, block_size: int = 100_000, **kwargs):
+        """
+        Create a ChunkedText from a text file without reading it into memory at once.
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls(id, pieces=iter(lambda: f.read(block_size), ""), **kwargs)
+
+
+    def iter_sentences(self, pieces):
+        """
+        Yield normalized German sentences from consecutive pieces of raw text.
+
+        Whitespace is normalized as in Text.get_text_stats. The last sentence of
+        every piece may be incomplete, so it is carried over and segmented again
+        together with the next piece. If the carried text grows beyond `max_chars`
+        (no sentence boundary found), it is emitted up to its last whitespace.
+
+        Parameters
+        ----------
+        pieces : iterable of str
+            Raw input text as consecutive pieces.
+
+        Yields
+        ------
+        str
+            Sentence strings obtained via German sentence segmentation.
+        """
+        carry = ""
+        for piece in pieces:
+            buffer = re.sub(r"\s+", " ", carry + piece)
+            sentences = sent_tokenize(buffer, language="german")
+            if not sentences:
+                carry = buffer
+                continue
+
+            yield from sentences[:-1]
+            carry = sentences[-1] + (" " if buffer.endswith(" ") else "")
+
+            if len(carry) > self.max_chars:
+                cut = carry.rstrip().rfind(" ")
+                if cut > 0:
+                    yield carry[:cut]
+                    carry = carry[cut + 1:]
+                else:
+                    yield carry.strip()
+                    carry = ""
+
+        if carry.strip():
+            yield from sent_tokenize(carry, language="german")
+
+
+    def split_long_sentence(self, sentence: str) -> list[str]:
+        """
+        Split a sentence longer than `max_chars` at whitespace into parts of at
+        most `max_chars` characters (a single longer word is cut hard).
+        """
+        parts = []
+        while len(sentence) > self.max_chars:
+            cut = sentence.rfind(" ", 0, self.max_chars + 1)
+            if cut <= 0:
+                cut = self.max_chars
+            parts.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if sentence:
+            parts.append(sentence)
+
+        return parts
+
+
+    def iter_chunks(self, pieces):
+        """
+        Group sentences into chunks of at most `max_chars` characters.
+
+        Yields
+        ------
+        list of str
+            Sentences of one chunk.
+        """
+        chunk = []
+        size = 0
+        for long_sentence in self.iter_sentences(pieces):
+            for sentence in self.split_long_sentence(long_sentence):
+                if chunk and size + len(sentence) + 1 > self.max_chars:
+                    yield chunk
+                    chunk = []
+                    size = 0
+                chunk.append(sentence)
+                size += len(sentence) + 1
+
+        if chunk:
+            yield chunk
+
+
+    def _init_partials(self, short_lt, long_gt, mtld_t, mattr_window):
+        """
+        Set up the partial results that are merged chunk by chunk.
+        """
+        # counts
+        self._word_count = 0
+        self._lemma_types = set()
+        self._lemma_count = 0
+        self._in_basic = 0
+
+        # sentence length moments
+        self.short_lt = short_lt
+        self.long_gt = long_gt
+        self._sentence_lengths = Counter()
+        self._sentence_count = 0
+        self._sentence_length_sum = 0
+        self._sentence_length_sum_sq = 0
+
+        # connector tallies
+        self._connector_freq = [Counter(), Counter(), Counter()]
+        self._connector_score_total = 0
+
+        # MTLD (forward pass, state carried across chunks)
+        self.mtld_t = mtld_t
+        self._mtld_factors = 0.0
+        self._mtld_types = set()
+        self._mtld_seg_len = 0
+
+        # MATTR (sliding window carried across chunks)
+        self.mattr_window = mattr_window
+        self._mattr_window = deque()
+        self._mattr_types = Counter()
+        self._mattr_ttrs_sum = 0.0
+        self._mattr_num_windows = 0
+
+
+    def add_chunk(self, sentences: list[str], text: str, lemma_pos: list[tuple]):
+        """
+        Merge the results of one chunk into the partial results.
+
+        Parameters
+        ----------
+        sentences : list of str
+            Sentence strings of the chunk.
+        text : str
+            The chunk text (sentences joined by a single space).
+        lemma_pos : list of tuples [str, str]
+            Tuples of (lemma, POS) for each alphabetic token of the chunk.
+        """
+
+        # counts
+        self._word_count += sum(1 for w in word_tokenize(text, language="german") if w.isalpha())
+        self._lemma_types.update(lemma_pos)
+        self._lemma_count += len(lemma_pos)
+        self._in_basic += sum(1 for w, _ in lemma_pos if w in self.basic_vocab)
+
+        # sentence length moments
+        for s in sentences:
+            length = sum(1 for w in word_tokenize(s, language="german") if w.isalpha())
+            self._sentence_lengths[length] += 1
+            self._sentence_count += 1
+            self._sentence_length_sum += length
+            self._sentence_length_sum_sq += length * length
+
+        # connector tallies
+        for token in lemma_pos:
+            for i, (connectors, pos) in enumerate(zip(self.all_connectors, ("CCONJ", "SCONJ", "ADV"))):
+                if token[0] in connectors and token[1] == pos:
+                    self._connector_freq[i][token[0]] += 1
+                    self._connector_score_total += LEVEL_SCORES.get(connectors[token[0]], 0)
+                    break
+
+        for token in lemma_pos:
+            # MTLD
+            self._mtld_seg_len += 1
+            self._mtld_types.add(token)
+            if len(self._mtld_types) / self._mtld_seg_len <= self.mtld_t:
+                self._mtld_factors += 1.0
+                self._mtld_types.clear()
+                self._mtld_seg_len = 0
+
+            # MATTR
+            self._mattr_window.append(token)
+            self._mattr_types[token] += 1
+            if len(self._mattr_window) > self.mattr_window:
+                old = self._mattr_window.popleft()
+                self._mattr_types[old] -= 1
+                if self._mattr_types[old] == 0:
+                    del self._mattr_types[old]
+            if len(self._mattr_window) == self.mattr_window:
+                self._mattr_ttrs_sum += len(self._mattr_types) / self.mattr_window
+                self._mattr_num_windows += 1
+
+
+    def _finalize(self):
+        """
+        Compute the final metrics from the merged partial results.
+        """
+        self.word_count = self._word_count
+        self.dif_word_count = len(self._lemma_types)
+        self.word_mtld = self.get_mtld()
+        self.word_mattr = self.get_mattr()
+        self.word_stats = round(self._in_basic / self._lemma_count, 2) if self._lemma_count else 0.0
+
+        self.sentence_count = self._sentence_count
+        self.sentence_lenght = (round(self.word_count / self.sentence_count, 2)
+                                if self.sentence_count else 0.0)
+        self.sentence_length_stats = self.get_sentence_length_stats()
+
+        self.connector_count = sum(sum(freq.values()) for freq in self._connector_freq)
+        self.connector_count_type = [sum(freq.values()) for freq in self._connector_freq]
+        self.dif_connector_count_type = [len(freq) for freq in self._connector_freq]
+        self.connector_per_sentence = (round(self.connector_count / self.sentence_count, 2)
+                                       if self.sentence_count else 0.0)
+        self.connector_stats = self.get_connector_stats()
+        self.connector_score_level = (self._connector_score_total / self.connector_count
+                                      if self.connector_count else 0.0)
+
+
+    def get_sentence_length_stats(self) -> dict:
+        """
+        Compute sentence length statistics from the merged length counts and moments.
+
+        Returns
+        -------
+        dict
+            Sentence length metrics (mean/median/std/min/max + share short/long),
+            as in Text.get_sentence_length_stats but without "lengths".
+        """
+        n = self._sentence_count
+        if not n:
+            return {
+                "n_sentences": 0,
+                "mean": 0,
+                "median": 0,
+                "std": 0,
+                "min": 0,
+                "max": 0,
+                "short_lt": self.short_lt,
+                "long_gt": self.long_gt,
+                "share_short": 0,
+                "share_long": 0,
+            }
+
+        mean = self._sentence_length_sum / n
+        variance = Fraction(n * self._sentence_length_sum_sq - self._sentence_length_sum ** 2, n * n)
+        std = math.sqrt(variance)
+
+        # median from the length counts
+        ordered = sorted(self._sentence_lengths)
+        middle = []
+        seen = 0
+        for length in ordered:
+            seen += self._sentence_lengths[length]
+            while len(middle) < 2 and seen > (n - 1) // 2 + len(middle):
+                middle.append(length)
+        median = middle[0] if n % 2 else (middle[0] + middle[1]) / 2
+
+        short_count = sum(c for L, c in self._sentence_lengths.items() if L < self.short_lt)
+        long_count = sum(c for L, c in self._sentence_lengths.items() if L > self.long_gt)
+
+        return {
+            "n_sentences": n,
+            "mean": round(mean, 2),
+            "median": round(median, 2),
+            "std": round(std, 2),
+            "min": ordered[0],
+            "max": ordered[-1],
+            "short_lt": self.short_lt,
+            "long_gt": self.long_gt,
+            "share_short": round(short_count / n, 3),
+            "share_long": round(long_count / n, 3),
+        }
+
+
+    def get_connector_stats(self) -> dict:
+        """
+        Compute connector frequency statistics from the merged connector tallies.
+
+        Returns
+        -------
+        dict
+            Number of distinct connectors and percentages for connectors used
+            once and >3 times (see get_connector_freq_stats).
+        """
+        freq = Counter()
+        for type_freq in self._connector_freq:
+            freq.update(type_freq)
+
+        return get_connector_freq_stats(freq)
+
+
+    def get_mtld(self) -> float:
+        """
+        Compute MTLD from the forward segment state carried across all chunks.
+
+        Returns
+        -------
+        float
+            The MTLD value, using the same final formula as Text.get_mtld.
+        """
+        factors = self._mtld_factors
+
+        # partial factor
+        if self._mtld_seg_len > 0:
+            ttr_end = len(self._mtld_types) / self._mtld_seg_len
+            factors += (1.0 - ttr_end) / (1.0 - self.mtld_t)
+
+        if factors <= 0:
+            return 0.0
+
+        return round((self._lemma_count / factors) / 2, 2)
+
+
+    def get_mattr(self) -> float:
+        """
+        Compute MATTR from the window TTRs summed across all chunks.
+
+        Returns
+        -------
+        float
+            The MATTR value (see Text.get_mattr).
+        """
+        n = self._lemma_count
+        if n == 0:
+            return 0.0
+
+        # If the text is shorter than the window, the window holds the whole text.
+        if n < self.mattr_window:
+            return len(self._mattr_types) / n
+
+        return round(self._mattr_ttrs_sum / self._mattr_num_windows, 2)
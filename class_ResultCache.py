@@ -0,0 +1,299 @@
+# ==========================================
+# File: class_ResultCache.py
+# Author: Dietmar Benndorf
+# Date: 2026-10-19
+# Description:
+#    Provides a ResultCache class that stores the metrics of analyzed texts,
+#    keyed by a hash of the whitespace-normalized text plus the analysis
+#    configuration. Identical submissions (also up to whitespace) are only
+#    analyzed once. The cache is an in-memory LRU and can optionally be
+#    backed by an SQLite file shared across runs and worker processes.
+# ==========================================
+
+
+from collections import OrderedDict
+from types import SimpleNamespace
+import hashlib
+import inspect
+import json
+import os
+import re
+import spacy
+import sqlite3
+
+from class_ChunkedText import ChunkedText
+from class_Text import Text, get_model_version
+from resources.list_basic_vocabulary import get_basic_vocabulary
+from resources.list_connectors import get_connectors
+
+
+# version of the stored metrics; increase when METRICS or their computation change
+METRICS_VERSION = "1"
+
+
+# Text attributes stored in the cache (all JSON serializable)
+METRICS = [
+    "word_count",
+    "dif_word_count",
+    "word_mtld",
+    "word_mattr",
+    "word_stats",
+    "sentence_count",
+    "sentence_lenght",
+    "sentence_length_stats",
+    "connector_count",
+    "connector_count_type",
+    "dif_connector_count_type",
+    "connector_per_sentence",
+    "connector_stats",
+    "connector_score_level",
+]
+
+
+class ResultCache:
+    """
+    Caches the metrics of analyzed texts in memory and optionally in SQLite.
+    """
+
+    def __init__(self, maxsize: int = 1024, path: str = None):
+        """
+        Parameters
+        ----------
+        maxsize : int, optional (default=1024)
+            Maximum number of results kept in memory (least recently used
+            results are dropped first).
+        path : str, optional
+            Path of an SQLite file shared across runs and worker processes.
+            If None, only the in-memory cache is used.
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self._memory = OrderedDict()
+        self._connection = None
+        self._pid = None
+
+        self.memory_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+        # resource lists are part of every key, so changing them invalidates old results
+        self._resources = hashlib.sha256(
+            json.dumps([get_connectors(), get_basic_vocabulary()], sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+
+    def get_config(self, factory, id: str, text, **kwargs) -> dict:
+        """
+        Return the full analysis configuration of a factory call.
+
+        All arguments (including defaults) except id and text are resolved from
+        the signature of `factory`. If `factory` has a get_config method (e.g.
+        TieredAnalysis), its settings are added as well. The spaCy version and
+        the versions of all models used are included, so upgrades invalidate
+        old results.
+        """
+        bound = inspect.signature(factory).bind(id, text, **kwargs)
+        bound.apply_defaults()
+        arguments = {name: value for name, value in bound.arguments.items()
+                     if name not in ("id", "text", "pieces")}
+
+        config = {
+            "factory": getattr(factory, "__name__", type(factory).__name__),
+            "version": METRICS_VERSION,
+            "resources": self._resources,
+            **arguments,
+        }
+        if hasattr(factory, "get_config"):
+            config.update(factory.get_config())
+
+        models = sorted(set(value for name, value in config.items()
+                            if name == "model" or name.endswith("_model")))
+        config["spacy"] = spacy.__version__
+        config["model_versions"] = {model: get_model_version(model) for model in models}
+
+        return config
+
+
+    def get_key(self, pieces, config: dict) -> str:
+        """
+        Return the cache key for a text and an analysis configuration.
+
+        The text is normalized as in Text.get_text_stats (and stripped), so
+        texts that differ only in whitespace share the same key. The text can
+        be given as one string or as consecutive pieces (e.g. blocks read from
+        a file); both give the same key.
+        """
+        if isinstance(pieces, str):
+            pieces = [pieces]
+
+        h = hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8"))
+        h.update(b"\n")
+
+        started = False
+        pending_space = False
+        for piece in pieces:
+            piece = re.sub(r"\s+", " ", piece)
+            if piece.startswith(" "):
+                pending_space = True
+            trailing_space = piece.endswith(" ")
+            piece = piece.strip()
+            if not piece:
+                continue
+
+            if pending_space and started:
+                h.update(b" ")
+            h.update(piece.encode("utf-8"))
+            started = True
+            pending_space = trailing_space
+
+        return h.hexdigest()
+
+
+    def analyze(self, id: str, text: str, factory=Text, **kwargs):
+        """
+        Return the metrics of a text, analyzing it only if it is not cached yet.
+
+        Parameters
+        ----------
+        id : str
+            Text id.
+        text : str
+            Raw input text in German.
+        factory : callable, optional (default=Text)
+            Used for the analysis as factory(id, text, **kwargs), e.g. Text,
+            ChunkedText or a TieredAnalysis.
+        **kwargs
+            Configuration passed to `factory`.
+
+        Returns
+        -------
+        SimpleNamespace
+            The text id and the attributes listed in METRICS.
+        """
+        key = self.get_key(text, self.get_config(factory, id, text, **kwargs))
+
+        metrics = self.get(key)
+        if metrics is None:
+            obj = factory(id, text, **kwargs)
+            metrics = {attr: getattr(obj, attr) for attr in METRICS}
+            self.put(key, metrics)
+
+        return SimpleNamespace(id=id, **metrics)
+
+
+    def analyze_file(self, id: str, path, block_size: int = 100_000, **kwargs):
+        """
+        Return the metrics of a (very long) text file, analyzing it chunk by chunk
+        with ChunkedText only if it is not cached yet. The file is hashed and
+        analyzed in blocks, so it is never read into memory at once.
+
+        Parameters
+        ----------
+        id : str
+            Text id.
+        path : str or Path
+            Path of the text file.
+        block_size : int, optional (default=100000)
+            Number of characters read at once.
+        **kwargs
+            Configuration passed to ChunkedText.
+
+        Returns
+        -------
+        SimpleNamespace
+            The text id and the attributes listed in METRICS.
+        """
+        config = self.get_config(ChunkedText, id, None, **kwargs)
+        with open(path, encoding="utf-8") as f:
+            key = self.get_key(iter(lambda: f.read(block_size), ""), config)
+
+        metrics = self.get(key)
+        if metrics is None:
+            obj = ChunkedText.from_file(id, path, block_size=block_size, **kwargs)
+            metrics = {attr: getattr(obj, attr) for attr in METRICS}
+            self.put(key, metrics)
+
+        return SimpleNamespace(id=id, **metrics)
+
+
+    def get(self, key: str):
+        """
+        Return the cached metrics for a key, or None.
+
+        Metrics are stored as JSON strings, so every call returns a new copy.
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return json.loads(self._memory[key])
+
+        if self.path is not None:
+            row = self._get_connection().execute(
+                "SELECT metrics FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._remember(key, row[0])
+                self.shared_hits += 1
+                return json.loads(row[0])
+
+        self.misses += 1
+        return None
+
+
+    def put(self, key: str, metrics: dict):
+        """
+        Store the metrics for a key.
+        """
+        metrics = json.dumps(metrics)
+        self._remember(key, metrics)
+
+        if self.path is not None:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO results (key, metrics) VALUES (?, ?)",
+                    (key, metrics),
+                )
+
+
+    def get_stats(self) -> dict:
+        """
+        Return hit/miss counters of the cache.
+        """
+        hits = self.memory_hits + self.shared_hits
+        total = hits + self.misses
+
+        return {
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / total, 3) if total else 0.0,
+            "size": len(self._memory),
+        }
+
+
+    def _remember(self, key: str, metrics: str):
+        """
+        Add metrics (as JSON string) to the in-memory LRU cache.
+        """
+        self._memory[key] = metrics
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+
+    def _get_connection(self):
+        """
+        Return the SQLite connection of the current process (opened lazily,
+        as connections must not be shared with forked worker processes).
+        """
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=30)
+            self._pid = os.getpid()
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, metrics TEXT)"
+                )
+
+        return self._connection
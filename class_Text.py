@@ -25,27 +25,112 @@ from resources.list_basic_vocabulary import get_basic_vocabulary
 from resources.list_connectors import get_connectors
 
 
+_MODELS = {}
+
+
+def load_model(model: str = "de_core_news_sm", disable: tuple = ()):
+    """
+    Load a spaCy model once and reuse it for all following texts.
+
+    Parameters
+    ----------
+    model : str, optional (default="de_core_news_sm")
+        Name of the spaCy model (sm = small, md = medium, lg = large).
+    disable : tuple of str, optional
+        Pipeline components to disable (e.g. ("parser", "ner") for a fast pass).
+
+    Returns
+    -------
+    spacy.language.Language
+        The loaded pipeline.
+    """
+    key = (model, tuple(disable))
+    if key not in _MODELS:
+        _MODELS[key] = spacy.load(model, disable=list(disable))
+    return _MODELS[key]
+
+
+def get_model_version(model: str = "de_core_news_sm") -> str:
+    """
+    Return the version of a spaCy model (as in nlp.meta["version"]).
+
+    The version is read from the installed package if possible, so the model
+    does not have to be loaded.
+    """
+    version = spacy.util.get_package_version(model)
+    if version is None:
+        version = load_model(model).meta["version"]
+    return version
+
+
+LEVEL_SCORES = {
+    "A1": 0,
+    "A2": 1,
+    "B1": 2,
+    "B2": 3,
+    "C1": 4,
+    "C2": 5,
+}
+
+
+def get_connector_freq_stats(freq: Counter) -> dict:
+    """
+    Compute connector frequency statistics from connector counts.
+
+    Parameters
+    ----------
+    freq : Counter
+        Counts per connector token.
+
+    Returns
+    -------
+    dict
+        Number of distinct connectors and percentages for connectors used
+        once and >3 times.
+    """
+    unique_used = len(freq)  # number of distinct connectors used
+
+    if unique_used == 0:
+        pct_once = 0.0
+        pct_more_than_3 = 0.0
+    else:
+        once = sum(1 for c in freq.values() if c == 1)
+        more_than_3 = sum(1 for c in freq.values() if c > 3)
+
+        pct_once = round((once / unique_used) * 100, 2)
+        pct_more_than_3 = round((more_than_3 / unique_used) * 100, 2)
+
+    return {
+        "unique_connectors_used": unique_used,
+        "pct_connectors_used_once": pct_once,
+        "pct_connectors_used_more_than_3": pct_more_than_3,
+    }
+
+
 class Text:
     """
     Represents a German text and provides basic linguistic analysis.
     """
 
-    def __init__(self, id: str, text: str):
+    def __init__(self, id: str, text: str, model: str = "de_core_news_sm", disable: tuple = ()):
         self.id = id
+        self.model = model
+        self.disable = tuple(disable)
 
-        self.text = self.get_text_stats(text)[0]
+        text_stats = self.get_text_stats(text)
+        self.text = text_stats[0]
 
         self.basic_vocab = [w.lower() for w in get_basic_vocabulary()]
-        self.words = self.get_text_stats(text)[2]
-        self.word_count = len(self.get_text_stats(text)[2])
-        self.dif_word_count = len(set(self.get_text_stats(text)[3]))
-        self.lemma_pos = self.get_text_stats(text)[3]
+        self.words = text_stats[2]
+        self.word_count = len(text_stats[2])
+        self.dif_word_count = len(set(text_stats[3]))
+        self.lemma_pos = text_stats[3]
         self.word_mtld = self.get_mtld(self.lemma_pos)  #[x for x, _ in self.lemma_po])
         self.word_mattr = self.get_mattr(self.lemma_pos)
         self.word_stats = self.get_word_stats(self.lemma_pos)
 
-        self.sentences = self.get_text_stats(text)[1]
-        self.sentence_count = len(self.get_text_stats(text)[1])
+        self.sentences = text_stats[1]
+        self.sentence_count = len(text_stats[1])
         self.sentence_lenght = round(self.word_count / self.sentence_count, 2)
         self.sentence_length_stats = self.get_sentence_length_stats(short_lt=6, long_gt=25)
 
@@ -73,7 +158,7 @@ class Text:
         2. Segment the text into German sentences using NLTK.
         3. Tokenize the text into alphabetic word forms (no punctuation or digits).
         4. Lemmatize alphabetic tokens and assign coarse-grained POS tags
-        using the spaCy German language model.
+        using the spaCy German language model (`self.model`).
 
         Parameters
         ----------
@@ -105,15 +190,13 @@ class Text:
         words = [w for w in word_tokenize(text, language="german") if w.isalpha()]
 
         # list words (lemma, pos)
-        nlp = spacy.load("de_core_news_sm")  # md = medium, lg = large
+        nlp = load_model(self.model, self.disable)
         doc = nlp(text)
-        for token in doc:
-            if token.is_alpha:
-                lemma_pos = [
-                    (token.lemma_.lower(), token.pos_)
-                    for token in doc
-                    if token.is_alpha
-                ]
+        lemma_pos = [
+            (token.lemma_.lower(), token.pos_)
+            for token in doc
+            if token.is_alpha
+        ]
 
         return [text, sentences, words, lemma_pos]
 
@@ -228,24 +311,7 @@ class Text:
                 connector_score.append(CONNECTOR_LEVEL[token[0]])
         connector_score = self.get_score_levels(connector_score)
 
-        freq = Counter(connectors)  # counts per connector token
-        unique_used = len(freq)  # number of distinct connectors used
-
-        if unique_used == 0:
-            pct_once = 0.0
-            pct_more_than_3 = 0.0
-        else:
-            once = sum(1 for c in freq.values() if c == 1)
-            more_than_3 = sum(1 for c in freq.values() if c > 3)
-
-            pct_once = round((once / unique_used) * 100, 2)
-            pct_more_than_3 = round((more_than_3 / unique_used) * 100, 2)
-
-        stats = {
-            "unique_connectors_used": unique_used,
-            "pct_connectors_used_once": pct_once,
-            "pct_connectors_used_more_than_3": pct_more_than_3,
-        }
+        stats = get_connector_freq_stats(Counter(connectors))
 
         return [connectors, connector_type, connector_score, stats]
 
@@ -265,15 +331,6 @@ class Text:
             Average numeric CEFR score
         """
 
-
-        LEVEL_SCORES = {
-            "A1": 0,
-            "A2": 1,
-            "B1": 2,
-            "B2": 3,
-            "C1": 4,
-            "C2": 5,
-        }
         total = 0
 
         for level in levels:
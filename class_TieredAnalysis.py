@@ -0,0 +1,196 @@
+# ==========================================
+# File: class_TieredAnalysis.py
+# Author: Dietmar Benndorf
+# Date: 2026-10-19
+# Description:
+#    Provides a TieredAnalysis class that analyzes texts with a fast spaCy
+#    pipeline first and re-runs only essays near grading thresholds (or flagged
+#    by a configurable rule) with a larger, more accurate model. Agreement
+#    statistics between both tiers are collected to check that the fast path
+#    does not skew connector or lexical diversity results.
+# ==========================================
+
+
+from class_Text import Text
+
+
+class TieredAnalysis:
+    """
+    Analyzes German texts in two tiers (fast path and accuracy path).
+    """
+
+    # metrics compared between the fast and the accurate tier
+    AGREEMENT_METRICS = ["connector_count", "connector_score_level", "word_mtld", "word_mattr"]
+
+    def __init__(self,
+                 fast_model: str = "de_core_news_sm",
+                 fast_disable: tuple = ("parser", "ner"),
+                 accurate_model: str = "de_core_news_lg",
+                 accurate_disable: tuple = (),
+                 thresholds: dict = None,
+                 margin: float = 0.25,
+                 flag_rule=None,
+                 flag_rule_name: str = None):
+        """
+        Parameters
+        ----------
+        fast_model : str, optional (default="de_core_news_sm")
+            spaCy model for the fast pass.
+        fast_disable : tuple of str, optional (default=("parser", "ner"))
+            Pipeline components disabled in the fast pass. Lemmatizer and
+            POS tagging are kept, as all metrics are based on (lemma, POS).
+        accurate_model : str, optional (default="de_core_news_lg")
+            spaCy model for the accuracy path.
+        accurate_disable : tuple of str, optional
+            Pipeline components disabled in the accuracy path.
+        thresholds : dict, optional
+            Grading thresholds per Text attribute, e.g.
+            {"connector_score_level": [2]}. Defaults to the B1 boundary (2)
+            of the connector score.
+        margin : float, optional (default=0.25)
+            A text is "near" a threshold if its value differs by at most `margin`.
+        flag_rule : callable, optional
+            Function Text -> bool; texts for which it returns True are re-run
+            with the accurate model as well.
+        flag_rule_name : str, optional
+            Stable id of `flag_rule` (required if a rule is given). It is part of
+            the cache key, so change it whenever the rule changes.
+        """
+        if flag_rule is not None and not flag_rule_name:
+            raise ValueError("flag_rule_name is required if flag_rule is given")
+
+        self.fast_model = fast_model
+        self.fast_disable = tuple(fast_disable)
+        self.accurate_model = accurate_model
+        self.accurate_disable = tuple(accurate_disable)
+        self.thresholds = thresholds if thresholds is not None else {"connector_score_level": [2]}
+        self.margin = margin
+        self.flag_rule = flag_rule
+        self.flag_rule_name = flag_rule_name if flag_rule is not None else None
+
+        # running tallies over all re-run texts
+        self.text_count = 0
+        self.rerun_count = 0
+        self.same_tokens = 0
+        self.compared_tokens = 0
+        self.metric_equal = {attr: 0 for attr in self.AGREEMENT_METRICS}
+        self.metric_diff_sum = {attr: 0.0 for attr in self.AGREEMENT_METRICS}
+        self.metric_abs_diff_sum = {attr: 0.0 for attr in self.AGREEMENT_METRICS}
+
+
+    def analyze(self, id: str, text: str) -> Text:
+        """
+        Analyze a text with the fast model and, if needed, with the accurate model.
+
+        Parameters
+        ----------
+        id : str
+            Text id.
+        text : str
+            Raw input text in German.
+
+        Returns
+        -------
+        Text
+            The accurate result if the text was re-run, otherwise the fast result.
+        """
+        self.text_count += 1
+        fast = Text(id, text, model=self.fast_model, disable=self.fast_disable)
+
+        if not self.needs_rerun(fast):
+            return fast
+
+        accurate = Text(id, text, model=self.accurate_model, disable=self.accurate_disable)
+        self.add_agreement(fast, accurate)
+
+        return accurate
+
+
+    def __call__(self, id: str, text: str) -> Text:
+        """
+        Same as analyze, so a TieredAnalysis can be used as factory (e.g. in ResultCache).
+        """
+        return self.analyze(id, text)
+
+
+    def get_config(self) -> dict:
+        """
+        Return the tier settings (e.g. as part of a cache key).
+        """
+        return {
+            "fast_model": self.fast_model,
+            "fast_disable": self.fast_disable,
+            "accurate_model": self.accurate_model,
+            "accurate_disable": self.accurate_disable,
+            "thresholds": self.thresholds,
+            "margin": self.margin,
+            "flag_rule": self.flag_rule_name,
+        }
+
+
+    def needs_rerun(self, obj: Text) -> bool:
+        """
+        Check whether a text is near a grading threshold or flagged by the rule.
+        """
+        for attr, values in self.thresholds.items():
+            value = getattr(obj, attr)
+            if any(abs(value - threshold) <= self.margin for threshold in values):
+                return True
+
+        return bool(self.flag_rule and self.flag_rule(obj))
+
+
+    def add_agreement(self, fast: Text, accurate: Text):
+        """
+        Add the comparison of one re-run text to the running tallies.
+        """
+        self.rerun_count += 1
+
+        if len(fast.lemma_pos) == len(accurate.lemma_pos):
+            self.same_tokens += sum(1 for a, b in zip(fast.lemma_pos, accurate.lemma_pos) if a == b)
+            self.compared_tokens += len(fast.lemma_pos)
+
+        for attr in self.AGREEMENT_METRICS:
+            diff = getattr(accurate, attr) - getattr(fast, attr)
+            self.metric_equal[attr] += diff == 0
+            self.metric_diff_sum[attr] += diff
+            self.metric_abs_diff_sum[attr] += abs(diff)
+
+
+    def get_agreement_stats(self) -> dict:
+        """
+        Compute agreement statistics between the fast and the accurate tier
+        over all re-run texts.
+
+        Returns
+        -------
+        dict
+            - n_texts : number of analyzed texts
+            - n_rerun : number of texts re-run with the accurate model
+            - lemma_pos_agreement : share of tokens with identical (lemma, POS)
+              (only texts with the same number of tokens in both tiers)
+            - per metric: share of texts with identical values ("agreement"),
+              mean difference accurate - fast ("mean_diff", i.e. skew of the
+              fast path) and mean absolute difference ("mean_abs_diff")
+            All values except the counts are None if no text was re-run.
+        """
+        n = self.rerun_count
+        result = {
+            "n_texts": self.text_count,
+            "n_rerun": n,
+            "lemma_pos_agreement": (round(self.same_tokens / self.compared_tokens, 3)
+                                    if self.compared_tokens else None),
+        }
+
+        for attr in self.AGREEMENT_METRICS:
+            if not n:
+                result[attr] = {"agreement": None, "mean_diff": None, "mean_abs_diff": None}
+                continue
+
+            result[attr] = {
+                "agreement": round(self.metric_equal[attr] / n, 3),
+                "mean_diff": round(self.metric_diff_sum[attr] / n, 3),
+                "mean_abs_diff": round(self.metric_abs_diff_sum[attr] / n, 3),
+            }
+
+        return result
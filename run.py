@@ -6,6 +6,7 @@
 #    Entry point of the project. Iterates over a directory of German text files,
 #    creates a Text object for each file, and triggers linguistic analysis such
 #    as tokenization, lexical diversity measures, and connector statistics.
+#    Very long texts are analyzed chunk by chunk with ChunkedText.
 # ==========================================
 
 
@@ -14,20 +15,48 @@ from pathlib import Path
 import re
 
 from class_Text import Text
+from class_ChunkedText import ChunkedText
 
 
-def main(source):
+def main(source, max_chars=100_000, tiers=None, cache=None):
     """
     Process all text files in a directory and analyze them.
+
+    Files larger than `max_chars` bytes are streamed and analyzed chunk by
+    chunk (see ChunkedText). If `tiers` (a TieredAnalysis) is given, the other texts
+    are analyzed with its fast path and re-run with the accurate model if needed;
+    long texts use only its fast model and are not compared across tiers.
+    If `cache` (a ResultCache) is given, repeated submissions are not analyzed
+    again (cached tiered results are not counted in the agreement report).
     """
 
     source_path = Path(source)
+    factory = tiers if tiers is not None else Text
+
+    # long texts are analyzed with the fast model only (not compared across tiers)
+    chunked_config = {"max_chars": max_chars}
+    if tiers is not None:
+        chunked_config.update(model=tiers.fast_model, disable=tiers.fast_disable)
+    chunked_count = 0
+    text_count = 0
 
     for file in tqdm(source_path.iterdir(), desc="Processing", unit=" texts done"):
         id = re.search(r"(\d+)(?=\.txt$)", str(file)).group(1)
-        text = file.read_text(encoding="utf-8")
+        text_count += 1
 
-        obj = Text(id, text)
+        if file.stat().st_size > max_chars:
+            chunked_count += 1
+            if cache is not None:
+                obj = cache.analyze_file(id, file, **chunked_config)
+            else:
+                obj = ChunkedText.from_file(id, file, **chunked_config)
+        else:
+            text = file.read_text(encoding="utf-8")
+
+            if cache is not None:
+                obj = cache.analyze(id, text, factory)
+            else:
+                obj = factory(id, text)
         print(f"\nText ID:   {obj.id}\n"
               f"###################\n\n"
               f"WORTSTATISTIK\n"
@@ -61,7 +90,27 @@ def main(source):
               f"   Konnektor Score (Level):   {obj.connector_score_level}\n"
               )
 
-        quit()
+    if tiers is not None:
+        agreement = tiers.get_agreement_stats()
+        print(f"\nTIER-ÜBEREINSTIMMUNG\n"
+              f"   Texte verarbeitet:   {text_count}\n"
+              f"   Texte analysiert (nicht aus Cache) | davon neu analysiert:   "
+              f"{agreement['n_texts']} | {agreement['n_rerun']}\n"
+              f"   Lange Texte (nur schneller Pfad, nicht verglichen):   {chunked_count}\n"
+              f"   Übereinstimmung Lemma/POS:   {agreement['lemma_pos_agreement']}")
+        for attr in tiers.AGREEMENT_METRICS:
+            print(f"   {attr} (Übereinstimmung | MEAN DIFF | MEAN ABS DIFF):   "
+                  f"{agreement[attr]['agreement']} | "
+                  f"{agreement[attr]['mean_diff']} | "
+                  f"{agreement[attr]['mean_abs_diff']}")
+
+    if cache is not None:
+        cache_stats = cache.get_stats()
+        print(f"\nCACHE\n"
+              f"   Texte verarbeitet:   {text_count}\n"
+              f"   Treffer (Speicher | SQLite) | Fehlschläge:   {cache_stats['hits']} "
+              f"({cache_stats['memory_hits']} | {cache_stats['shared_hits']}) | {cache_stats['misses']}\n"
+              f"   Trefferquote:   {cache_stats['hit_rate']}")
 
 
 if __name__ == "__main__":